@@ -5,8 +5,14 @@ import logging
 import os
 
 import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant
-from homeassistant.helpers.template import area_id, area_name
+from homeassistant.helpers import area_registry, device_registry, entity_registry
 
 from .const import (
     ATTRIBUTES_TO_CHECK,
@@ -27,6 +33,24 @@ from .helpers import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Split the attribute lists once at import time: colour attributes go through
+# compare_colors (with a flag for xy scaling), everything else through
+# compare_values. Saves the endswith/get calls on every state change.
+_COLOR_ATTRS = {
+    domain: tuple(
+        (attribute, attribute == "xy_color")
+        for attribute in attributes
+        if attribute.endswith("_color")
+    )
+    for domain, attributes in ATTRIBUTES_TO_CHECK.items()
+}
+_PLAIN_ATTRS = {
+    domain: tuple(
+        attribute for attribute in attributes if not attribute.endswith("_color")
+    )
+    for domain, attributes in ATTRIBUTES_TO_CHECK.items()
+}
+
 
 class StatefulScenesYamlNotFound(Exception):
     """Raised when specified yaml is not found."""
@@ -54,6 +78,7 @@ class Hub:
         hass: HomeAssistant,
         scene_path: str,
         number_tolerance: int = 3,
+        scene_confs: list | None = None,
     ) -> None:
         """Initialize the Hub class.
 
@@ -62,6 +87,8 @@ class Hub:
             scene_path (str): Path to the yaml file containing the scenes
             external_scenes (list): List of external scenes
             number_tolerance (int): Tolerance for comparing numbers
+            scene_confs (list): Already loaded scene configurations; when
+                None the scenes file is read synchronously
 
         Raises:
             StatefulScenesYamlNotFound: If the yaml file is not found
@@ -74,40 +101,71 @@ class Hub:
         self.scenes = []
         self.scene_confs = []
 
-        if self.scene_path:
+        # Area lookups resolved so far, keyed by entity_id. Scenes in the
+        # same area would otherwise repeat the registry lookups.
+        self._area_cache: dict[str, str] = {}
+        self._entity_registry = entity_registry.async_get(hass)
+        self._device_registry = device_registry.async_get(hass)
+        self._area_registry = area_registry.async_get(hass)
+
+        # Reverse index of scene id -> entity_id, built once so that each
+        # scene lookup is O(1) instead of scanning every scene entity.
+        self._id_to_entity_id = {}
+        for entity_id in hass.states.async_entity_ids("scene"):
+            state = hass.states.get(entity_id)
+            if state is not None and state.attributes.get("id") is not None:
+                self._id_to_entity_id[state.attributes["id"]] = entity_id
+
+        if not self.scene_path:
+            raise StatefulScenesYamlNotFound("No scenes file specified.")
+
+        if scene_confs is None:
             scene_confs = self.load_scenes()
-            for scene_conf in scene_confs:
-                if not self.validate_scene(scene_conf):
-                    continue
-                self.scenes.append(
-                    Scene(
-                        self.hass,
-                        self.extract_scene_configuration(scene_conf),
-                    )
-                )
-                self.scene_confs.append(self.extract_scene_configuration(scene_conf))
+        for scene_conf in scene_confs:
+            if not self.validate_scene(scene_conf):
+                continue
+            conf = self.extract_scene_configuration(scene_conf)
+            self.scenes.append(Scene(self.hass, conf))
+            self.scene_confs.append(conf)
 
-        else:
-            raise StatefulScenesYamlNotFound("No scenes file specified.")
+    @classmethod
+    async def async_create(
+        cls,
+        hass: HomeAssistant,
+        scene_path: str,
+        number_tolerance: int = 3,
+    ) -> "Hub":
+        """Create a Hub without blocking the event loop on the YAML load."""
+        scene_confs = await hass.async_add_executor_job(
+            cls._load_scenes_file, scene_path
+        )
+        return cls(hass, scene_path, number_tolerance, scene_confs=scene_confs)
 
     def load_scenes(self) -> list:
         """Load scenes from yaml file."""
+        return self._load_scenes_file(self.scene_path)
+
+    @staticmethod
+    def _load_scenes_file(scene_path: str) -> list:
+        """Read and parse the scenes yaml file (blocking)."""
         # check if file exists
-        if self.scene_path is None:
+        if scene_path is None:
             raise StatefulScenesYamlNotFound("Scenes file not specified.")
-        if not os.path.exists(self.scene_path):
-            raise StatefulScenesYamlNotFound("No scenes file " + self.scene_path)
+        if not os.path.exists(scene_path):
+            raise StatefulScenesYamlNotFound("No scenes file " + scene_path)
 
         try:
-            with open(self.scene_path, encoding="utf-8") as f:
-                scenes_confs = yaml.load(f, Loader=yaml.FullLoader)
+            # Binary mode lets the loader consume bytes directly (it handles
+            # the encoding/BOM itself), skipping the Python-level decode pass.
+            with open(scene_path, "rb") as f:
+                scenes_confs = yaml.load(f, Loader=_YamlLoader)
         except OSError as err:
             raise StatefulScenesYamlInvalid(
-                "No scenes found in " + self.scene_path
+                "No scenes found in " + scene_path
             ) from err
 
         if not scenes_confs or not isinstance(scenes_confs, list):
-            raise StatefulScenesYamlInvalid("No scenes found in " + self.scene_path)
+            raise StatefulScenesYamlInvalid("No scenes found in " + scene_path)
 
         return scenes_confs
 
@@ -157,7 +215,7 @@ class Hub:
         """
         entities = {}
         for entity_id, scene_attributes in scene_conf["entities"].items():
-            domain = entity_id.split(".")[0]
+            domain = entity_id.partition(".")[0]
             attributes = {"state": scene_attributes["state"]}
 
             if domain in ATTRIBUTES_TO_CHECK:
@@ -168,6 +226,8 @@ class Hub:
             entities[entity_id] = attributes
 
         entity_id = scene_conf.get("entity_id", None)
+        if entity_id is None:
+            entity_id = self._id_to_entity_id.get(scene_conf.get("id"))
         if entity_id is None:
             entity_id = get_entity_id_from_id(self.hass, scene_conf.get("id"))
 
@@ -178,7 +238,7 @@ class Hub:
                 "icon", get_icon_from_entity_id(self.hass, entity_id)
             ),
             "entity_id": entity_id,
-            "area": area_name(self.hass, area_id(self.hass, entity_id)),
+            "area": self.get_area_from_entity_id(entity_id),
             "learn": scene_conf.get("learn", False),
             "entities": entities,
             "number_tolerance": scene_conf.get(
@@ -186,6 +246,36 @@ class Hub:
             ),
         }
 
+    def get_area_from_entity_id(self, entity_id: str) -> str:
+        """Get the area name for an entity, cached per hub.
+
+        Looks up the registries directly instead of going through the
+        area_id/area_name template helpers, falling back to the entity's
+        device for the area like the template helper does.
+        """
+        if entity_id in self._area_cache:
+            return self._area_cache[entity_id]
+
+        area = None
+        entity = (
+            self._entity_registry.async_get(entity_id)
+            if entity_id is not None
+            else None
+        )
+        if entity is not None:
+            entity_area_id = entity.area_id
+            if entity_area_id is None and entity.device_id is not None:
+                device = self._device_registry.async_get(entity.device_id)
+                if device is not None:
+                    entity_area_id = device.area_id
+            if entity_area_id is not None:
+                area_entry = self._area_registry.async_get_area(entity_area_id)
+                if area_entry is not None:
+                    area = area_entry.name
+
+        self._area_cache[entity_id] = area
+        return area
+
     def prepare_external_scene(self, entity_id, entities) -> dict:
         """Prepare external scene configuration."""
         return {
@@ -193,7 +283,7 @@ class Hub:
             "id": get_id_from_entity_id(self.hass, entity_id),
             "icon": get_icon_from_entity_id(self.hass, entity_id),
             "entity_id": entity_id,
-            "area": area_name(self.hass, area_id(self.hass, entity_id)),
+            "area": self.get_area_from_entity_id(entity_id),
             "learn": True,
             "entities": entities,
         }
@@ -222,7 +312,18 @@ class Scene:
         self.callback = None
         self.callback_funcs = {}
         self.schedule_update = None
-        self.states = {entity_id: False for entity_id in self.entities}
+        self._entity_ids = tuple(self.entities)
+        # Each entity's domain is fixed by its entity_id, so resolve the
+        # attribute lists to check once here instead of per state change.
+        self._entity_check_attrs = {
+            entity_id: (
+                _PLAIN_ATTRS.get(entity_id.partition(".")[0], ()),
+                _COLOR_ATTRS.get(entity_id.partition(".")[0], ()),
+            )
+            for entity_id in self.entities
+        }
+        self._matched: set[str] = set()
+        self._unknown: set[str] = set()
         self.restore_states = {entity_id: None for entity_id in self.entities}
 
         if self.learn:
@@ -269,7 +370,7 @@ class Scene:
             self.hass.services.call(
                 domain="homeassistant",
                 service="turn_off",
-                target={"entity_id": list(self.entities.keys())},
+                target={"entity_id": list(self._entity_ids)},
             )
 
         self._is_on = False
@@ -330,7 +431,7 @@ class Scene:
             raise ValueError("No callback functions provided for scene.")
         self.schedule_update = schedule_update_func
         self.callback = state_change_func(
-            self.hass, self.entities.keys(), self.update_callback
+            self.hass, self._entity_ids, self.update_callback
         )
 
     def unregister_callback(self):
@@ -357,27 +458,39 @@ class Scene:
         if not self.compare_values(old_state.state, new_state.state):
             return True
 
-        if new_state.domain in ATTRIBUTES_TO_CHECK:
+        # State-only changes reuse the attributes dict between the old and
+        # new state, so an identical object means nothing tracked changed.
+        if old_state.attributes is new_state.attributes:
+            return False
+
+        check_attrs = self._entity_check_attrs.get(new_state.entity_id)
+        if check_attrs is None:
+            domain = new_state.domain
+            check_attrs = (
+                _PLAIN_ATTRS.get(domain, ()),
+                _COLOR_ATTRS.get(domain, ()),
+            )
+        plain_attrs, color_attrs = check_attrs
+        if plain_attrs or color_attrs:
             entity_attrs = new_state.attributes
             old_entity_attrs = old_state.attributes
-            for attribute in ATTRIBUTES_TO_CHECK.get(new_state.domain):
+            for attribute in plain_attrs:
                 if attribute not in old_entity_attrs or attribute not in entity_attrs:
                     continue
-
-                match = False
-                if attribute.endswith("_color"):
-                    match = self.compare_colors(
-                        old_entity_attrs[attribute],
-                        entity_attrs[attribute],
-                        attribute == "xy_color"
-                    )
+                if not self.compare_values(
+                    old_entity_attrs[attribute], entity_attrs[attribute]
+                ):
+                    return True
+            for attribute, is_xy_color in color_attrs:
+                if attribute not in old_entity_attrs or attribute not in entity_attrs:
+                    continue
+                match = self.compare_colors(
+                    old_entity_attrs[attribute],
+                    entity_attrs[attribute],
+                    is_xy_color,
+                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("Update: Key '[%s]': compare colors - %sMATCHED", attribute, "" if match else "NOT ")
-                else:
-                    match = self.compare_values(
-                        old_entity_attrs[attribute],
-                        entity_attrs[attribute]
-                    )
-
                 if not match:
                     return True
         return False
@@ -385,54 +498,63 @@ class Scene:
     def check_state(self, entity_id, new_state):
         """Check the state of the scene."""
         if new_state is None:
-            _LOGGER.warning(f"Entity not found: {entity_id}")
+            _LOGGER.warning("Entity not found: %s", entity_id)
             return False
 
-        if self.ignore_unavailable and new_state.state == "unavailable":
+        if self._ignore_unavailable and new_state.state == "unavailable":
             return None
 
+        wanted = self.entities[entity_id]
+
         # Check state
-        if not self.compare_values(self.entities[entity_id]["state"], new_state.state):
+        if not self.compare_values(wanted["state"], new_state.state):
             _LOGGER.debug(
                 "[%s] state not matching: %s: wanted=%s got=%s.",
                 self.name,
                 entity_id,
-                self.entities[entity_id]["state"],
+                wanted["state"],
                 new_state.state,
             )
             return False
 
         # Check attributes
-        if new_state.domain in ATTRIBUTES_TO_CHECK:
+        plain_attrs, color_attrs = self._entity_check_attrs.get(
+            entity_id, ((), ())
+        )
+        if plain_attrs or color_attrs:
             entity_attrs = new_state.attributes
-            for attribute in ATTRIBUTES_TO_CHECK.get(new_state.domain):
-                if (
-                    attribute not in self.entities[entity_id]
-                    or attribute not in entity_attrs
-                ):
+            for attribute in plain_attrs:
+                if attribute not in wanted or attribute not in entity_attrs:
                     continue
-
-                match = False
-                if attribute.endswith("_color"):
-                    match = self.compare_colors(
-                        self.entities[entity_id][attribute],
+                if not self.compare_values(
+                    wanted[attribute], entity_attrs[attribute]
+                ):
+                    _LOGGER.debug(
+                        "[%s] attribute not matching: %s %s: wanted=%s got=%s.",
+                        self.name,
+                        entity_id,
+                        attribute,
+                        wanted[attribute],
                         entity_attrs[attribute],
-                        attribute == "xy_color"
                     )
+                    return False
+            for attribute, is_xy_color in color_attrs:
+                if attribute not in wanted or attribute not in entity_attrs:
+                    continue
+                match = self.compare_colors(
+                    wanted[attribute],
+                    entity_attrs[attribute],
+                    is_xy_color,
+                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("Check: Key '[%s]': compare colors - %sMATCHED", attribute, "" if match else "NOT ")
-                else:
-                    match = self.compare_values(
-                        self.entities[entity_id][attribute],
-                        entity_attrs[attribute]
-                    )
-
                 if not match:
                     _LOGGER.debug(
                         "[%s] attribute not matching: %s %s: wanted=%s got=%s.",
                         self.name,
                         entity_id,
                         attribute,
-                        self.entities[entity_id][attribute],
+                        wanted[attribute],
                         entity_attrs[attribute],
                     )
                     return False
@@ -450,22 +572,27 @@ class Scene:
         in the desired state, the scene is off. Unavaiblable entities are ignored, but
         if all entities are unavailable, the scene is off.
         """
+        matched = self._matched
+        unknown = self._unknown
+        matched.clear()
+        unknown.clear()
+        states_get = self.hass.states.get
+        restore_on_deactivate = self._restore_on_deactivate
         for entity_id in self.entities:
-            state = self.hass.states.get(entity_id)
-            self.states[entity_id] = self.check_state(entity_id, state)
-
+            state = self.check_state(entity_id, states_get(entity_id))
+            if state:
+                matched.add(entity_id)
+            elif state is None:
+                unknown.add(entity_id)
             # Shortcut checking all entities when restore on deactivate is turned off to save checking all states
             # and attributes. When restore on deactivate is turned on, we update all states
-            if not self.restore_on_deactivate and not self.states[entity_id]:
+            elif not restore_on_deactivate:
                 self._is_on = False
                 return
 
-        states = [state for state in self.states.values() if state is not None]
-
-        if not states:
-            self._is_on = False
-
-        self._is_on = all(states)
+        self._is_on = bool(matched) and (
+            len(matched) + len(unknown) == len(self.entities)
+        )
 
     def store_entity_state(self, entity_id, state):
         """Store the state of an entity."""
@@ -477,13 +604,24 @@ class Scene:
         for entity_id, state in self.restore_states.items():
             if state is None:
                 continue
-            entities[entity_id] = {"state": state.state}
-            if state.domain in ATTRIBUTES_TO_CHECK:
+            restored = {"state": state.state}
+            attrs_to_copy = ATTRIBUTES_TO_CHECK.get(state.domain, ())
+            if attrs_to_copy:
                 entity_attrs = state.attributes
-                for attribute in ATTRIBUTES_TO_CHECK.get(state.domain):
-                    if attribute not in entity_attrs:
-                        continue
-                    entities[entity_id][attribute] = entity_attrs[attribute]
+                restored.update(
+                    {
+                        attribute: entity_attrs[attribute]
+                        for attribute in attrs_to_copy
+                        if attribute in entity_attrs
+                    }
+                )
+            entities[entity_id] = restored
+
+        if not entities:
+            # Nothing recorded to restore (e.g. scene never saw a state
+            # change); skip the round-trip through the service registry.
+            self._is_on = False
+            return
 
         service_data = {"entities": entities}
         if self._transition_time is not None:
@@ -493,41 +631,52 @@ class Scene:
         )
 
     def compare_values(self, value1, value2):
-        """Compare two values."""
-        if isinstance(value1, dict) and isinstance(value2, dict):
-            return self.compare_dicts(value1, value2)
-
-        if (isinstance(value1, list) or isinstance(value1, tuple)) and (
-            isinstance(value2, list) or isinstance(value2, tuple)
-        ):
-            return self.compare_lists(value1, value2)
-
-        if (isinstance(value1, int) or isinstance(value1, float)) and (
-            isinstance(value2, int) or isinstance(value2, float)
-        ):
-            return self.compare_numbers(value1, value2)
+        """Compare two values.
 
+        Runs on every tracked attribute of every state change, so dispatch on
+        exact types first and inline the element compare for the small
+        lists/dicts that light attributes produce.
+        """
+        value_type = type(value1)
+        if value_type is type(value2):
+            if value_type is int or value_type is float:
+                return abs(value1 - value2) <= self._number_tolerance
+            if value_type is dict:
+                compare = self.compare_values
+                for key, item1 in value1.items():
+                    if key not in value2 or not compare(item1, value2[key]):
+                        return False
+                return True
+            if value_type is list or value_type is tuple:
+                tolerance = self._number_tolerance
+                compare = self.compare_values
+                for item1, item2 in zip(value1, value2):
+                    item_type = type(item1)
+                    if (item_type is int or item_type is float) and (
+                        item_type is type(item2)
+                    ):
+                        if abs(item1 - item2) > tolerance:
+                            return False
+                    elif not compare(item1, item2):
+                        return False
+                return True
+            return value1 == value2
+
+        # Mixed types: ints still compare numerically against floats, and
+        # lists compare element-wise against tuples.
+        if isinstance(value1, (int, float)) and isinstance(value2, (int, float)):
+            return abs(value1 - value2) <= self._number_tolerance
+        if isinstance(value1, (list, tuple)) and isinstance(value2, (list, tuple)):
+            compare = self.compare_values
+            for item1, item2 in zip(value1, value2):
+                if not compare(item1, item2):
+                    return False
+            return True
         return value1 == value2
 
-    def compare_dicts(self, dict1, dict2):
-        """Compare two dicts."""
-        for key, value in dict1.items():
-            if key not in dict2:
-                return False
-            if not self.compare_values(value, dict2[key]):
-                return False
-        return True
-
-    def compare_lists(self, list1, list2):
-        """Compare two lists."""
-        for value1, value2 in zip(list1, list2):
-            if not self.compare_values(value1, value2):
-                return False
-        return True
-
     def compare_numbers(self, number1, number2):
         """Compare two numbers."""
-        return abs(number1 - number2) <= self.number_tolerance
+        return abs(number1 - number2) <= self._number_tolerance
 
     def compare_colors(self, color1, color2, is_xy_color: bool):
         """Compare two colors."""
@@ -536,17 +685,20 @@ class Scene:
         if color1 is None or color2 is None:
             return False
 
-        if (not (isinstance(color1, list) or isinstance(color1, tuple)) and
-            not (isinstance(color2, list) or isinstance(color2, tuple))
+        if not isinstance(color1, (list, tuple)) or not isinstance(
+            color2, (list, tuple)
         ):
-            _LOGGER.debug(f"Colours are not lists or tupples: {color1}:{color2}")
+            _LOGGER.debug("Colours are not lists or tuples: %s:%s", color1, color2)
             return False
 
+        # xy colours are from -1:1 on each axis. Scaling the tolerance down
+        # once is equivalent to multiplying every component difference by 100
+        # and keeps the loop to a single abs/compare per component.
+        tolerance = self._number_tolerance
+        if is_xy_color:
+            tolerance /= 100
         for component1, component2 in zip(color1, color2):
-            # xy colours are from -1:1 on each axis. By multiplying the component values by 100, we get back to a range
-            # we can compare using self.number_tolerance.
-            factor = 100 if is_xy_color else 1
-            if abs(component1 - component2) * factor > self.number_tolerance:
+            if abs(component1 - component2) > tolerance:
                 return False
         return True
 
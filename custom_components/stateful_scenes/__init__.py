@@ -29,7 +29,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if is_hub is None:
         is_hub = CONF_SCENE_PATH in entry.data
     if is_hub:
-        hass.data[DOMAIN][entry.entry_id] = Hub(
+        hass.data[DOMAIN][entry.entry_id] = await Hub.async_create(
             hass=hass,
             scene_path=entry.data[CONF_SCENE_PATH],
             number_tolerance=entry.data[CONF_NUMBER_TOLERANCE],
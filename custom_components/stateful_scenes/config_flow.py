@@ -79,7 +79,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                self.hub = Hub(
+                self.hub = await Hub.async_create(
                     hass=self.hass,
                     scene_path=user_input[CONF_SCENE_PATH],
                     number_tolerance=user_input[CONF_NUMBER_TOLERANCE],